@@ -1,6 +1,4 @@
 from flask import Flask, render_template, request, jsonify
-import mysql.connector
-from Backend import app
 from datetime import datetime, timedelta
 from Backend.DataCreate.realtime import get_latest_data_temperature, get_latest_data_lux
 
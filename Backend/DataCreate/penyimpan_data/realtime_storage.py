@@ -1,9 +1,4 @@
-import mysql.connector
-from config import DB_CON
-
-def get_db_connection():
-    """Membuat koneksi ke database LuxGrow"""
-    return mysql.connector.connect(**DB_CON)
+from config import get_db_connection
 
 def simpan_data_lux(lux_value):
     """
@@ -1,16 +1,9 @@
 from flask import Flask, render_template, request, jsonify
-import mysql.connector
-from Backend import app
 from datetime import datetime, timedelta
 
 from flask import Flask, render_template, request, jsonify
-import mysql.connector
-from Backend import app
 from datetime import datetime, timedelta
-from config import DB_CON
-
-def get_db_connection():
-    return mysql.connector.connect(**DB_CON)
+from config import get_db_connection
 
 latest_realtime_data_lux={}
 def update_realtime_lux():
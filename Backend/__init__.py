@@ -1,6 +1,12 @@
-from flask import Flask 
-app = Flask(__name__)
+from flask import Flask
 
 
-from Backend import route
+def create_app():
+    """Buat Flask app baru dan daftarkan blueprint; database baru disentuh saat request pertama"""
+    from Backend import route
+    from Backend import admission
 
+    app = Flask(__name__)
+    app.register_blueprint(admission.bp)
+    app.register_blueprint(route.bp)
+    return app
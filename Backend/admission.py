@@ -0,0 +1,139 @@
+import os
+import threading
+from flask import Blueprint, request, jsonify, g
+
+# Admission control untuk route API.
+# Ingest (POST /api/realtime/*, /api/store/*) dan read (GET /api/*) punya
+# budget in-flight masing-masing, jadi ingest yang tertahan MySQL tidak
+# menghabiskan worker yang dibutuhkan dashboard.
+#
+# Budget berlaku per proses dan hanya efektif dengan server multi-thread
+# (dev server Flask, atau gunicorn --worker-class gthread). Jumlah thread per
+# worker harus > total in-flight + antrian kedua pool (default 4+4+8+8 = 24)
+# plus cadangan untuk route yang tidak lewat admission (health probe, /,
+# /assets/*, POST servo), mis. 32 thread, supaya request di-shed dengan 429
+# dan liveness probe tetap dijawab saat semua slot pool terpakai.
+INGEST_MAX_INFLIGHT = int(os.getenv('INGEST_MAX_INFLIGHT', 4))
+INGEST_MAX_QUEUE = int(os.getenv('INGEST_MAX_QUEUE', 4))
+INGEST_QUEUE_TIMEOUT = float(os.getenv('INGEST_QUEUE_TIMEOUT', 0.5))
+READ_MAX_INFLIGHT = int(os.getenv('READ_MAX_INFLIGHT', 8))
+READ_MAX_QUEUE = int(os.getenv('READ_MAX_QUEUE', 8))
+READ_QUEUE_TIMEOUT = float(os.getenv('READ_QUEUE_TIMEOUT', 2.0))
+RETRY_AFTER = int(os.getenv('ADMISSION_RETRY_AFTER', 2))
+
+INGEST_PREFIXES = ('/api/realtime/', '/api/store/')
+STATS_PATH = '/api/admission/stats'
+EXEMPT_PATHS = (STATS_PATH, '/api/health/live', '/api/health/ready')
+
+
+class AdmissionPool:
+    def __init__(self, name, max_inflight, max_queue, queue_timeout):
+        self.name = name
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.slots = threading.BoundedSemaphore(max_inflight)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+
+    def acquire(self):
+        """Ambil slot; tunggu sebentar jika penuh, return False jika harus di-shed"""
+        if self.slots.acquire(blocking=False):
+            with self.lock:
+                self.in_flight += 1
+                self.admitted += 1
+            return True
+
+        with self.lock:
+            if self.waiting >= self.max_queue:
+                self.shed += 1
+                return False
+            self.waiting += 1
+            self.queued += 1
+
+        acquired = self.slots.acquire(timeout=self.queue_timeout)
+        with self.lock:
+            self.waiting -= 1
+            if acquired:
+                self.in_flight += 1
+                self.admitted += 1
+            else:
+                self.shed += 1
+        return acquired
+
+    def release(self):
+        with self.lock:
+            self.in_flight -= 1
+        self.slots.release()
+
+    def retry_after(self):
+        """Saran jeda (detik) untuk client, naik sesuai panjang antrian"""
+        with self.lock:
+            backlog = self.waiting + self.in_flight
+        return RETRY_AFTER * max(1, -(-backlog // self.max_inflight))
+
+    def stats(self):
+        with self.lock:
+            return {
+                'max_inflight': self.max_inflight,
+                'max_queue': self.max_queue,
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                'admitted': self.admitted,
+                'queued': self.queued,
+                'shed': self.shed
+            }
+
+
+ingest_pool = AdmissionPool('ingest', INGEST_MAX_INFLIGHT, INGEST_MAX_QUEUE, INGEST_QUEUE_TIMEOUT)
+read_pool = AdmissionPool('read', READ_MAX_INFLIGHT, READ_MAX_QUEUE, READ_QUEUE_TIMEOUT)
+
+bp = Blueprint('admission', __name__)
+
+
+def classify_request():
+    """Tentukan pool untuk request saat ini, None jika tidak dibatasi"""
+    path = request.path
+    if path in EXEMPT_PATHS:
+        return None
+    if request.method == 'POST' and path.startswith(INGEST_PREFIXES):
+        return ingest_pool
+    if request.method == 'GET' and path.startswith('/api/'):
+        return read_pool
+    return None
+
+
+@bp.before_app_request
+def admit_request():
+    pool = classify_request()
+    if pool is None:
+        return None
+
+    if not pool.acquire():
+        retry_after = pool.retry_after()
+        response = jsonify({'error': 'Server busy, retry later', 'retry_after': retry_after})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(retry_after)
+        return response
+
+    g.admission_pool = pool
+    return None
+
+
+@bp.teardown_app_request
+def release_request(exc=None):
+    pool = g.pop('admission_pool', None)
+    if pool is not None:
+        pool.release()
+
+
+@bp.route(STATS_PATH, methods=['GET'])
+def get_admission_stats():
+    return jsonify({
+        'ingest': ingest_pool.stats(),
+        'read': read_pool.stats()
+    })
@@ -1,57 +1,96 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
-import mysql.connector
-from Backend import app
+import os
+import threading
+import time
+from flask import Flask, Blueprint, render_template, request, jsonify, abort
 from datetime import datetime, timedelta
 from Backend.DataCreate.pengolahan import process_group_condition,get_latest_data_condition
-from config import DB_CON
+from config import get_db_connection
+from Backend.static_assets import serve_index, serve_asset, compress_json_response
 from Backend.DataCreate.realtime import (
     update_realtime_lux, get_latest_data_lux,
     update_realtime_temperature, get_latest_data_temperature,
     set_servo_mode, send_servo_command, get_servo_command, get_servo_status
 )
-def get_db_connection():
-    return mysql.connector.connect(**DB_CON)
 
-@app.route('/')
+bp = Blueprint('luxgrow', __name__)
+
+# Readiness probe memakai timeout pendek dan hasilnya di-cache sebentar,
+# supaya probe ke database yang mati tidak menahan thread worker
+READINESS_TIMEOUT = int(os.getenv('READINESS_TIMEOUT', 1))
+READINESS_CACHE_SECONDS = float(os.getenv('READINESS_CACHE_SECONDS', 5))
+_readiness = {'checked_at': 0, 'ready': False}
+_readiness_lock = threading.Lock()
+
+@bp.route('/')
 def index():
-    return send_from_directory('..','index.html')
+    return serve_index()
 
-@app.route('/assets/<path:filename>')
+@bp.route('/assets/<path:filename>')
 def serve_assets(filename):
-    return send_from_directory('../assets', filename)
-@app.route('/api')
+    response = serve_asset(filename)
+    if response is None:
+        abort(404)
+    return response
+
+@bp.after_app_request
+def compress_response(response):
+    return compress_json_response(response)
+
+@bp.route('/api')
 def api():
     return "ini adalah api"
 
-@app.route('/api/realtime/lux', methods=['POST'])
+@bp.route('/api/health/live', methods=['GET'])
+def liveness():
+    return jsonify({'status': 'alive'}), 200
+
+@bp.route('/api/health/ready', methods=['GET'])
+def readiness():
+    with _readiness_lock:
+        if time.time() - _readiness['checked_at'] >= READINESS_CACHE_SECONDS:
+            try:
+                conn = get_db_connection(connection_timeout=READINESS_TIMEOUT)
+                conn.close()
+                _readiness['ready'] = True
+            except Exception as e:
+                print(f"Readiness check failed: {e}")
+                _readiness['ready'] = False
+            _readiness['checked_at'] = time.time()
+        ready = _readiness['ready']
+
+    if ready:
+        return jsonify({'status': 'ready', 'database': 'ok'}), 200
+    return jsonify({'status': 'not ready', 'database': 'unavailable'}), 503
+
+@bp.route('/api/realtime/lux', methods=['POST'])
 def receive_realtime():
     return update_realtime_lux()
 
 
-@app.route('/api/realtime/lux', methods=['GET'])
+@bp.route('/api/realtime/lux', methods=['GET'])
 def get_realtime():
     return get_latest_data_lux()
 
 
-@app.route('/api/realtime/dht', methods=['POST'])
+@bp.route('/api/realtime/dht', methods=['POST'])
 def receive_realtime_temperature():
     return update_realtime_temperature()
 
 
 
-@app.route('/api/realtime/dht', methods=['GET'])
+@bp.route('/api/realtime/dht', methods=['GET'])
 def get_realtime_temperature():
     return get_latest_data_temperature()
 
-@app.route('/api/realtime/condition', methods=['GET'])
+@bp.route('/api/realtime/condition', methods=['GET'])
 def get_realtime_condition():
     return jsonify(get_latest_data_condition())
 
-@app.route('/api/realtime/condition', methods=['POST'])
+@bp.route('/api/realtime/condition', methods=['POST'])
 def post_realtime_condition():
     return process_group_condition() 
 
-@app.route('/api/store/lux', methods=['POST'])
+@bp.route('/api/store/lux', methods=['POST'])
 def store_data_lux():
     try:
         data = request.get_json() or {}
@@ -77,7 +116,7 @@ def store_data_lux():
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/api/store/dht', methods=['POST'])
+@bp.route('/api/store/dht', methods=['POST'])
 def store_data_temperature():
     try:
         data = request.get_json() or {}
@@ -105,19 +144,19 @@ def store_data_temperature():
 
 #FUNGSI UNTUK SERVO
 # Servo Routes
-@app.route('/api/servo/mode', methods=['POST'])
+@bp.route('/api/servo/mode', methods=['POST'])
 def set_servo_mode_route():
     return set_servo_mode()
 
-@app.route('/api/servo/command', methods=['POST'])
+@bp.route('/api/servo/command', methods=['POST'])
 def send_servo_command_route():
     return send_servo_command()
 
-@app.route('/api/servo/command', methods=['GET'])
+@bp.route('/api/servo/command', methods=['GET'])
 def get_servo_command_route():
     return jsonify(get_servo_command())
 
-@app.route('/api/servo/status', methods=['GET'])
+@bp.route('/api/servo/status', methods=['GET'])
 def get_servo_status_route():
     return jsonify(get_servo_status())
 
@@ -0,0 +1,164 @@
+import os
+import gzip
+import hashlib
+import mimetypes
+import threading
+from flask import current_app, has_app_context, request, Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Pipeline aset statis: file di-fingerprint dengan hash konten, dikompres
+# (gzip/brotli) sekali saat startup (warm_assets) atau saat pertama dibutuhkan,
+# lalu disajikan dari memori dengan cache header panjang + ETag supaya browser
+# jarang balik ke worker. Dalam mode debug hasil build diperbarui jika file
+# sumber berubah.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT_DIR, 'assets')
+INDEX_FILE = os.path.join(ROOT_DIR, 'index.html')
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+COMPRESS_MIN_SIZE = 512
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+JSON_GZIP_MIN_SIZE = int(os.getenv('JSON_GZIP_MIN_SIZE', 1024))
+
+
+class StaticAsset:
+    def __init__(self, logical_path, content, mimetype):
+        self.logical_path = logical_path
+        self.mimetype = mimetype
+        self.content = content
+        self.digest = hashlib.sha256(content).hexdigest()
+        self.etag = self.digest[:16]
+        self.encoded = {}
+
+        if len(content) >= COMPRESS_MIN_SIZE and mimetype.startswith(COMPRESSIBLE_TYPES):
+            self.encoded['gzip'] = gzip.compress(content, compresslevel=9, mtime=0)
+            if brotli is not None:
+                self.encoded['br'] = brotli.compress(content)
+
+    @property
+    def fingerprinted_path(self):
+        base, ext = os.path.splitext(self.logical_path)
+        return f"{base}.{self.digest[:10]}{ext}"
+
+
+_built = None
+_build_lock = threading.Lock()
+
+
+def guess_mimetype(path):
+    # Charset ditambahkan otomatis oleh Werkzeug untuk tipe teks
+    return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def source_mtime():
+    """mtime terbaru dari index.html dan semua file di assets/"""
+    latest = os.path.getmtime(INDEX_FILE)
+    for dirpath, _, filenames in os.walk(ASSETS_DIR):
+        for filename in filenames:
+            latest = max(latest, os.path.getmtime(os.path.join(dirpath, filename)))
+    return latest
+
+
+def build_assets():
+    """Baca semua file di assets/, fingerprint dan kompres, lalu tulis ulang index.html"""
+    manifest = {}
+    for dirpath, _, filenames in os.walk(ASSETS_DIR):
+        for filename in filenames:
+            full_path = os.path.join(dirpath, filename)
+            logical_path = os.path.relpath(full_path, ASSETS_DIR).replace(os.sep, '/')
+            with open(full_path, 'rb') as f:
+                asset = StaticAsset(logical_path, f.read(), guess_mimetype(logical_path))
+            manifest[logical_path] = asset
+            manifest[asset.fingerprinted_path] = asset
+
+    with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+        html = f.read()
+    for logical_path, asset in list(manifest.items()):
+        if logical_path == asset.logical_path:
+            html = html.replace(f'"assets/{logical_path}"', f'"assets/{asset.fingerprinted_path}"')
+    index = StaticAsset('index.html', html.encode('utf-8'), 'text/html')
+
+    return manifest, index
+
+
+def get_assets():
+    global _built
+    debug = has_app_context() and current_app.debug
+    built = _built
+    if built is None or (debug and built[2] < source_mtime()):
+        with _build_lock:
+            if _built is None or _built is built:
+                mtime = source_mtime()
+                manifest, index = build_assets()
+                _built = (manifest, index, mtime)
+            built = _built
+    return built[0], built[1]
+
+
+def warm_assets():
+    """Build aset saat startup supaya request pertama tidak membayar biayanya"""
+    get_assets()
+
+
+def preferred_encoding(asset):
+    for encoding in ('br', 'gzip'):
+        if encoding in asset.encoded and request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+
+def make_asset_response(asset, cache_control):
+    encoding = preferred_encoding(asset)
+    body = asset.encoded[encoding] if encoding else asset.content
+
+    response = Response(body, mimetype=asset.mimetype)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if asset.encoded:
+        response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = cache_control
+    response.set_etag(f"{asset.etag}-{encoding}" if encoding else asset.etag)
+    return response.make_conditional(request)
+
+
+def serve_index():
+    _, index = get_assets()
+    return make_asset_response(index, REVALIDATE_CACHE)
+
+
+def serve_asset(filename):
+    """Sajikan aset; URL ber-hash dapat cache immutable, path lama tetap revalidate"""
+    manifest, _ = get_assets()
+    asset = manifest.get(filename)
+    if asset is None:
+        return None
+    if filename == asset.fingerprinted_path:
+        return make_asset_response(asset, IMMUTABLE_CACHE)
+    return make_asset_response(asset, REVALIDATE_CACHE)
+
+
+def compress_json_response(response):
+    """Gzip response JSON API yang lebih besar dari JSON_GZIP_MIN_SIZE"""
+    if (response.mimetype != 'application/json'
+            or response.status_code < 200 or response.status_code >= 300
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    data = response.get_data()
+    if len(data) < JSON_GZIP_MIN_SIZE:
+        return response
+
+    # Response ini punya varian terkompres, cache harus membedakannya
+    response.vary.add('Accept-Encoding')
+    if not request.accept_encodings['gzip']:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
@@ -1,6 +1,8 @@
-from Backend import app
-from Backend import DataCreate 
-from Backend import route 
+from Backend import create_app
+from Backend.static_assets import warm_assets
+
+app = create_app()
+warm_assets()
 
 if __name__ == '__main__':
     app.run(debug=True)
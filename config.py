@@ -1,24 +1,25 @@
-import os 
-from dotenv import load_dotenv 
-import mysql.connector
+import os
+from dotenv import load_dotenv
 
-load_dotenv()
+# Konfigurasi dibaca saat pertama kali dipakai (bukan saat import), jadi
+# worker bisa start walaupun database sedang mati.
+_db_config = None
 
-DB_CON = {
-    'host': os.getenv('DB_HOST'),
-    'database': os.getenv('DB_NAME'),
-    'port': int(os.getenv('DB_PORT')),
-    'user': os.getenv('DB_USER'),
-    'password': os.getenv('DB_PASSWORD')
-}
+def get_db_config():
+    global _db_config
+    if _db_config is None:
+        load_dotenv()
+        _db_config = {
+            'host': os.getenv('DB_HOST'),
+            'database': os.getenv('DB_NAME'),
+            'port': int(os.getenv('DB_PORT') or 3306),
+            'user': os.getenv('DB_USER'),
+            'password': os.getenv('DB_PASSWORD'),
+            'connection_timeout': int(os.getenv('DB_CONNECT_TIMEOUT') or 5)
+        }
+    return _db_config
 
-# Debug print
-print(f"DB Config: {DB_CON}")
-
-# Test koneksi database
-try:
-    conn = mysql.connector.connect(**DB_CON)
-    print("✓ Database connection successful")
-    conn.close()
-except Exception as e:
-    print(f"✗ Database connection failed: {e}")
+def get_db_connection(**overrides):
+    """Buka koneksi MySQL baru; mysql.connector baru di-import saat dibutuhkan"""
+    import mysql.connector
+    return mysql.connector.connect(**{**get_db_config(), **overrides})
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark waktu startup aplikasi (python -X importtime) dengan budget regresi.
+
+Jalankan dari root project:
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py --update-baseline   # rekam baseline baru
+
+Yang dihitung hanya import di bawah modul aplikasi (APP_MODULES); import
+milik interpreter (site, encodings) dan harness (socket) tidak ikut.
+Baseline berbeda per mesin: rekam ulang di setiap host CI dengan
+--update-baseline.
+
+Gagal jika:
+- total import melebihi budget absolut (--budget-ms),
+- total import naik lebih dari max_regression_pct dari baseline di
+  scripts/startup_baseline.json,
+- mysql.connector ikut ter-import saat startup, atau
+- ada koneksi jaringan (mis. ke database) selama startup.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(ROOT_DIR, 'scripts', 'startup_baseline.json')
+DEFAULT_BUDGET_MS = int(os.getenv('STARTUP_BUDGET_MS', 350))
+FORBIDDEN_MODULES = ('mysql', 'mysql.connector', '_mysql_connector')
+APP_MODULES = ('Backend', 'config', 'flask')
+CONNECT_EXIT_CODE = 3
+
+# Semua connect() lewat socket diblok, jadi koneksi DB saat import langsung gagal
+STARTUP_CODE = f"""
+import socket, sys
+def _blocked_connect(self, address):
+    print(f'network connect during startup: {{address}}', file=sys.stderr)
+    raise SystemExit({CONNECT_EXIT_CODE})
+socket.socket.connect = _blocked_connect
+socket.socket.connect_ex = _blocked_connect
+from Backend import create_app
+create_app()
+"""
+
+
+def run_importtime():
+    env = dict(os.environ)
+    env.update({
+        'DB_HOST': '192.0.2.1',  # TEST-NET-1, tidak pernah bisa dijangkau
+        'DB_PORT': '3306',
+        'DB_CONNECT_TIMEOUT': '1'
+    })
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_CODE],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode == CONNECT_EXIT_CODE:
+        for line in result.stderr.splitlines():
+            if line.startswith('network connect during startup'):
+                print(line, file=sys.stderr)
+        raise SystemExit("FAIL: startup opened a network connection")
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        raise SystemExit(f"Startup failed (exit code {result.returncode})")
+    return result.stderr, wall_ms
+
+
+def parse_importtime(output):
+    """Return (list (module, self_us, cumulative_us) top-level, set semua modul)"""
+    modules = []
+    imported = set()
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imported.add(name.strip())
+        if name.startswith('  '):
+            continue
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules, imported
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_FILE):
+        return None
+    with open(BASELINE_FILE) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LuxGrow startup benchmark')
+    parser.add_argument('--budget-ms', type=int, default=DEFAULT_BUDGET_MS,
+                        help='Batas total waktu import (ms)')
+    parser.add_argument('--top', type=int, default=10,
+                        help='Jumlah modul terlambat yang ditampilkan')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Simpan hasil sekarang sebagai baseline')
+    args = parser.parse_args()
+
+    output, wall_ms = run_importtime()
+    modules, imported = parse_importtime(output)
+    modules = [m for m in modules if m[0].split('.')[0] in APP_MODULES]
+    total_ms = sum(cumulative for _, _, cumulative in modules) / 1000
+    baseline = load_baseline()
+
+    print(f"{'cumulative ms':>14}  module")
+    for name, _, cumulative in sorted(modules, key=lambda m: m[2], reverse=True)[:args.top]:
+        print(f"{cumulative / 1000:>14.1f}  {name}")
+    print("-" * 50)
+    print(f"Import total : {total_ms:.1f} ms")
+    print(f"Process wall : {wall_ms:.1f} ms")
+    print(f"Budget       : {args.budget_ms} ms")
+
+    if args.update_baseline:
+        baseline = {
+            'import_ms': round(total_ms, 1),
+            'max_regression_pct': baseline['max_regression_pct'] if baseline else 50
+        }
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        print(f"Baseline updated: {BASELINE_FILE}")
+
+    failures = []
+    forbidden = sorted(imported.intersection(FORBIDDEN_MODULES))
+    if forbidden:
+        failures.append(f"imported at startup: {', '.join(forbidden)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds budget {args.budget_ms} ms")
+    if baseline:
+        limit_ms = baseline['import_ms'] * (1 + baseline['max_regression_pct'] / 100)
+        print(f"Baseline     : {baseline['import_ms']} ms (limit {limit_ms:.1f} ms)")
+        if total_ms > limit_ms:
+            failures.append(f"import time {total_ms:.1f} ms regressed past baseline limit {limit_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,6 +14,8 @@ SERVO_PIN = 18
 AUTO_LUX_TOO_BRIGHT = 22800
 AUTO_LUX_TOO_DARK = 300
 DUMMY_MODE = True
+BACKOFF_BASE = 2
+BACKOFF_MAX = 60
 
 def init_lux_sensor():
     global lux_sensor
@@ -129,13 +131,50 @@ class LuxGrowClient:
         init_dht_sensor()
         self.servo = ServoController()
         self.running = True
+        # Backoff terpisah per pool server (ingest = POST, read = GET), supaya
+        # 429 dari ingest tidak menghentikan polling servo dan sebaliknya
+        self.backoff_lock = threading.Lock()
+        self.backoff = {
+            'ingest': {'until': 0, 'attempt': 0},
+            'read': {'until': 0, 'attempt': 0}
+        }
         print("Initialized")
-        
+
+    def backoff_delay(self, retry_after, attempt):
+        try:
+            base = float(retry_after)
+        except (TypeError, ValueError):
+            base = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+        return min(BACKOFF_MAX, base) * random.uniform(1.0, 1.5)
+
+    def request_with_backoff(self, method, path, **kwargs):
+        request_class = 'ingest' if method == 'POST' else 'read'
+        state = self.backoff[request_class]
+        # Server sedang overload: lewati request sampai jeda selesai
+        with self.backoff_lock:
+            if time.time() < state['until']:
+                return None
+        response = requests.request(method, f"{BACKEND_URL}{path}", timeout=5, **kwargs)
+        with self.backoff_lock:
+            if response.status_code in (429, 503):
+                delay = self.backoff_delay(response.headers.get('Retry-After'), state['attempt'])
+                state['attempt'] += 1
+                state['until'] = time.time() + delay
+                print(f"Backend busy ({response.status_code}, {request_class}), backing off {delay:.1f}s")
+            else:
+                state['attempt'] = 0
+        return response
+
+    def post_data(self, path, data):
+        return self.request_with_backoff("POST", path, json=data)
+
     def send_lux_data(self, lux_value):
         try:
             data = {"lux": lux_value, "timestamp": datetime.now().isoformat()}
-            response = requests.post(f"{BACKEND_URL}/api/realtime/lux", json=data, timeout=5)
-            if response.status_code == 200:
+            response = self.post_data("/api/realtime/lux", data)
+            if response is None:
+                print(f"Lux skipped (backoff): {lux_value}")
+            elif response.status_code == 200:
                 print(f"Lux sent: {lux_value}")
             else:
                 print(f"Lux failed: {response.status_code}")
@@ -145,8 +184,10 @@ class LuxGrowClient:
     def send_dht_data(self, temperature, humidity):
         try:
             data = {"temperature": temperature, "humidity": humidity, "timestamp": datetime.now().isoformat()}
-            response = requests.post(f"{BACKEND_URL}/api/realtime/dht", json=data, timeout=5)
-            if response.status_code == 200:
+            response = self.post_data("/api/realtime/dht", data)
+            if response is None:
+                print(f"DHT skipped (backoff): {temperature}C, {humidity}%")
+            elif response.status_code == 200:
                 print(f"DHT sent: {temperature}C, {humidity}%")
             else:
                 print(f"DHT failed: {response.status_code}")
@@ -155,8 +196,8 @@ class LuxGrowClient:
 
     def check_servo_command(self):
         try:
-            response = requests.get(f"{BACKEND_URL}/api/servo/command", timeout=5)
-            if response.status_code == 200:
+            response = self.request_with_backoff("GET", "/api/servo/command")
+            if response is not None and response.status_code == 200:
                 command_data = response.json()
                 if command_data:
                     command = command_data.get('command')
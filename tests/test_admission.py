@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+from flask import jsonify
+
+from Backend import create_app
+from Backend import admission, route
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(admission, 'ingest_pool', admission.AdmissionPool('ingest', 2, 2, 5.0))
+    monkeypatch.setattr(admission, 'read_pool', admission.AdmissionPool('read', 1, 0, 0.1))
+
+    def db_down(**kwargs):
+        raise ConnectionError('database down')
+    monkeypatch.setattr(route, 'get_db_connection', db_down)
+    monkeypatch.setattr(route, '_readiness', {'checked_at': 0, 'ready': False})
+
+    app = create_app()
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return jsonify({'status': 'success'}), 200
+
+    app.add_url_rule('/api/realtime/slow', 'slow_ingest', slow, methods=['POST'])
+    app.add_url_rule('/api/realtime/slow', 'slow_read', slow, methods=['GET'])
+    app.release = release
+    yield app
+    release.set()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError('condition not reached')
+
+
+def run_concurrently(app, method, path, count):
+    responses = []
+    lock = threading.Lock()
+
+    def worker():
+        response = app.test_client().open(path, method=method)
+        with lock:
+            responses.append(response)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, responses
+
+
+def test_ingest_over_budget_is_shed_with_retry_after(app):
+    pool = admission.ingest_pool
+    threads, responses = run_concurrently(app, 'POST', '/api/realtime/slow', 6)
+
+    # 2 in-flight + 2 antri, sisanya langsung di-shed
+    wait_for(lambda: pool.stats()['shed'] == 2 and pool.stats()['waiting'] == 2)
+    app.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [200, 200, 200, 200, 429, 429]
+    for response in responses:
+        if response.status_code == 429:
+            assert int(response.headers['Retry-After']) >= 1
+
+    stats = pool.stats()
+    assert stats['in_flight'] == 0
+    assert stats['waiting'] == 0
+    assert stats['admitted'] == 4
+    assert stats['queued'] == 2
+
+
+def test_exempt_routes_are_never_shed(app):
+    pool = admission.read_pool
+    threads, _ = run_concurrently(app, 'GET', '/api/realtime/slow', 1)
+    wait_for(lambda: pool.stats()['in_flight'] == 1)
+
+    client = app.test_client()
+    assert client.get('/api/realtime/lux').status_code == 429
+    assert client.get('/api/health/live').status_code == 200
+    assert client.get('/api/health/ready').status_code == 503
+    stats = client.get('/api/admission/stats')
+    assert stats.status_code == 200
+    assert stats.get_json()['read']['shed'] == 1
+
+    app.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert pool.stats()['in_flight'] == 0
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from Backend import create_app
+from Backend import static_assets
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    assets_dir = tmp_path / 'assets'
+    (assets_dir / 'js').mkdir(parents=True)
+    (assets_dir / 'js' / 'app.js').write_text('console.log("v1");\n' * 100)
+    index_file = tmp_path / 'index.html'
+    index_file.write_text('<script src="assets/js/app.js"></script>')
+
+    monkeypatch.setattr(static_assets, 'ASSETS_DIR', str(assets_dir))
+    monkeypatch.setattr(static_assets, 'INDEX_FILE', str(index_file))
+    monkeypatch.setattr(static_assets, '_built', None)
+    return tmp_path
+
+
+def test_fingerprinted_asset_is_immutable_and_conditional(site):
+    client = create_app().test_client()
+    html = client.get('/').get_data(as_text=True)
+    hashed = html.split('src="')[1].split('"')[0]
+    assert hashed != 'assets/js/app.js'
+
+    response = client.get('/' + hashed, headers={'Accept-Encoding': 'gzip, br;q=0'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Content-Type'].count('charset') <= 1
+    assert 'immutable' in response.headers['Cache-Control']
+
+    again = client.get('/' + hashed, headers={'Accept-Encoding': 'gzip',
+                                             'If-None-Match': response.headers['ETag']})
+    assert again.status_code == 304
+
+
+def test_debug_mode_picks_up_edited_sources(site):
+    app = create_app()
+    app.debug = True
+    client = app.test_client()
+    first = client.get('/assets/js/app.js').get_data(as_text=True)
+
+    app_js = site / 'assets' / 'js' / 'app.js'
+    app_js.write_text('console.log("v2");\n')
+    stat = os.stat(app_js)
+    os.utime(app_js, (stat.st_atime, stat.st_mtime + 10))
+
+    second = client.get('/assets/js/app.js').get_data(as_text=True)
+    assert 'v1' in first
+    assert 'v2' in second